@@ -69,3 +69,30 @@ class LoggingAPI(ABC):
         #pylint: disable=no-self-use
 
         del name
+
+    @abstractmethod
+    def flush(self, timeout: float = None) -> None:
+
+        """Waits until all log entries written so far reached their targets.
+
+        Args:
+            timeout (float): Maximum time in seconds to wait.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        #pylint: disable=no-self-use
+
+        del timeout
+
+    @abstractmethod
+    def shutdown(self) -> None:
+
+        """Writes all pending log entries and stops any background writer.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        #pylint: disable=no-self-use
@@ -234,6 +234,7 @@ class Application(LogWriter):
             # to avoid leftover files.
             if self._type == ApplicationTypes.DAEMON_APPLICATION:
                 self.delete_pid()
+                self._shutdown_log_system()
             raise
         except Exception as error:
             self._business_logic.on_uncaught_exception(error)
@@ -245,6 +246,7 @@ class Application(LogWriter):
             self.warning(
                 'Leaving the main loop of a daemon application, cleaning up.')
             self.delete_pid()
+            self._shutdown_log_system()
 
         return result
 
@@ -442,6 +444,22 @@ class Application(LogWriter):
             else:
                 raise OSError from error
 
+    def _shutdown_log_system(self) -> None:
+
+        """Makes sure that all pending log entries are written before the
+        daemon exits.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        # Pylint doesn't recognize the instance() method of Singleton.
+        #pylint: disable=no-member
+
+        logging_system = SystemLocator.instance().get_provider(LoggingAPI)
+        if logging_system:
+            logging_system.shutdown()
+
     def _validate_license(
         self,
         public_key: str,
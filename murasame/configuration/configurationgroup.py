@@ -364,8 +364,8 @@ class ConfigurationGroup(LogWriter):
                        f'exist in group {self.Name}, cannot add.')
             return
 
-        self.debug(f'Adding configuration attribute {attribute.Name} to '
-                   f'configuration group {self.Name}.')
+        self.debug('Adding configuration attribute %s to '
+                   'configuration group %s.', attribute.Name, self.Name)
 
         self._attributes[attribute.Name] = attribute
 
@@ -386,13 +386,13 @@ class ConfigurationGroup(LogWriter):
             return
 
         if self.has_top_level_group(group.Name):
-            self.debug(f'Configuration group {self.Name} already has a group '
-                       f'named {group.Name}, merging the two.')
+            self.debug('Configuration group %s already has a group '
+                       'named %s, merging the two.', self.Name, group.Name)
             self._groups[group.Name].merge_with(group)
             return
 
-        self.debug(f'Adding configuration group {group.Name} to group '
-                   f'{self.Name}.')
+        self.debug('Adding configuration group %s to group '
+                   '%s.', group.Name, self.Name)
 
         self._groups[group.Name] = group
 
@@ -413,13 +413,14 @@ class ConfigurationGroup(LogWriter):
             return
 
         if self.has_top_level_list(config_list.Name):
-            self.debug(f'Configuration group {self.Name} already has a list '
-                       f'named {config_list.Name}, merging the two.')
+            self.debug('Configuration group %s already has a list '
+                       'named %s, merging the two.',
+                       self.Name, config_list.Name)
             self._lists[config_list.Name].merge_with(config_list)
             return
 
-        self.debug(f'Adding configuration list {config_list.Name} to group '
-                   f'{self.Name}.')
+        self.debug('Adding configuration list %s to group '
+                   '%s.', config_list.Name, self.Name)
         self._lists[config_list.Name] = config_list
 
     def merge_with(self, other: 'ConfigurationGroup') -> None:
@@ -444,15 +445,16 @@ class ConfigurationGroup(LogWriter):
                        f'{other.Name} does not match, cannot merge.')
             return
 
-        self.debug(f'Merging configuration group {other.Name} into '
-                   f'{self.Name}.')
+        self.debug('Merging configuration group %s into '
+                   '%s.', other.Name, self.Name)
 
         # Merge attributes
         attributes = other.Attributes.items()
         for attribute in attributes:
             if self.has_top_level_attribute(attribute[0]):
-                self.debug(f'Configuration group {self.Name} already has an '
-                           f'attribute with name {attribute[0]}, won\'t merge,')
+                self.debug('Configuration group %s already has an '
+                           'attribute with name %s, won\'t merge,',
+                           self.Name, attribute[0])
                 continue
 
             self.add_attribute(attribute[1])
@@ -461,28 +463,30 @@ class ConfigurationGroup(LogWriter):
         groups = other.Groups.items()
         for group in groups:
             if self.has_top_level_group(group[0]):
-                self.debug(f'Configuration group {self.Name} already has a '
-                           f'sub-group with name {group[0]}, merging the two.')
+                self.debug('Configuration group %s already has a '
+                           'sub-group with name %s, merging the two.',
+                           self.Name, group[0])
                 parent = self._groups[group[0]]
                 parent.merge_with(group[1])
             else:
-                self.debug(f'Configuration group {self.Name} does not have a '
-                           f'sub-group with name {group[0]}, adding it as a '
-                           f'new one.')
+                self.debug('Configuration group %s does not have a '
+                           'sub-group with name %s, adding it as a '
+                           'new one.', self.Name, group[0])
                 self.add_group(group[1])
 
         # Merge lists
         lists = other.Lists.items()
         for clist in lists:
             if self.has_top_level_list(clist[0]):
-                self.debug(f'Configuration group {self.Name} already has a '
-                           f'list with name {clist[0]}, merging the two.')
+                self.debug('Configuration group %s already has a '
+                           'list with name %s, merging the two.',
+                           self.Name, clist[0])
                 parent = self._lists[clist[0]]
                 parent.merge_with(clist[1])
             else:
-                self.debug(f'Configuration group {self.Name} does not have a '
-                           f'list with name {clist[1]}, adding it as a new '
-                           f'one.')
+                self.debug('Configuration group %s does not have a '
+                           'list with name %s, adding it as a new '
+                           'one.', self.Name, clist[1])
                 self.add_list(clist[1])
 
     def _split_attribute_name(self, name: str) -> 'str, str':
@@ -504,9 +508,9 @@ class ConfigurationGroup(LogWriter):
 
         split_name = str.split(name, '.', 1)
 
-        self.debug(f'Input string {name} was split. Identified configuration '
-                   f'group: {split_name[0]} Identified attribute: '
-                   f'{split_name[1]}')
+        self.debug('Input string %s was split. Identified configuration '
+                   'group: %s Identified attribute: '
+                   '%s', name, split_name[0], split_name[1])
 
         return (split_name[0], split_name[1])
 
@@ -521,7 +525,7 @@ class ConfigurationGroup(LogWriter):
             Attila Kovacs
         """
 
-        self.debug(f'Parsing configuration group {self.Name}')
+        self.debug('Parsing configuration group %s', self.Name)
 
         for entry_key, entry_content in content.items():
 
@@ -547,7 +551,7 @@ class ConfigurationGroup(LogWriter):
                 raise InvalidInputError(f'Failed to parse configuration group '
                                         f'{self.Name}.') from error
 
-        self.debug(f'Configuration group {self.Name} parsed successfully.')
+        self.debug('Configuration group %s parsed successfully.', self.Name)
 
     def _identify_entry_type(self, content: object) -> str:
 
@@ -600,7 +604,7 @@ class ConfigurationGroup(LogWriter):
             Attila Kovacs
         """
 
-        self.debug(f'Processing configuration group {entry_key}')
+        self.debug('Processing configuration group %s', entry_key)
 
         if self.has_top_level_group(entry_key):
             raise AlreadyExistsError(
@@ -609,7 +613,7 @@ class ConfigurationGroup(LogWriter):
         self._groups[entry_key] = ConfigurationGroup(name=entry_key,
                                                      content=entry_content)
 
-        self.debug(f'New configuration group successfully added: {entry_key}')
+        self.debug('New configuration group successfully added: %s', entry_key)
 
     def _process_entry_as_list(self,
                                entry_key: str,
@@ -625,7 +629,7 @@ class ConfigurationGroup(LogWriter):
             Attila Kovacs
         """
 
-        self.debug(f'Processing configuration entry list {entry_key}')
+        self.debug('Processing configuration entry list %s', entry_key)
 
         if self.has_top_level_list(entry_key):
             raise AlreadyExistsError(
@@ -634,7 +638,7 @@ class ConfigurationGroup(LogWriter):
         self._lists[entry_key] = ConfigurationList(name=entry_key,
                                                    content=entry_content)
 
-        self.debug(f'New list successfully added: {entry_key}')
+        self.debug('New list successfully added: %s', entry_key)
 
     def _process_entry_as_attribute(self,
                                     entry_key: str,
@@ -652,7 +656,7 @@ class ConfigurationGroup(LogWriter):
             Attila Kovacs
         """
 
-        self.debug(f'Processing configuration attribute {entry_key}')
+        self.debug('Processing configuration attribute %s', entry_key)
 
         if self.has_top_level_attribute(entry_key):
             raise AlreadyExistsError(
@@ -661,4 +665,4 @@ class ConfigurationGroup(LogWriter):
         self._attributes[entry_key] = ConfigurationAttribute(
             name=entry_key, value=entry_content, data_type=entry_type)
 
-        self.debug(f'New attribute successfully added: {entry_key}')
+        self.debug('New attribute successfully added: %s', entry_key)
@@ -108,13 +108,13 @@ class DictionaryBackend(ConfigurationBackend):
                        'invalid name.')
             return None
 
-        self.debug(f'Retrieving value for attribute {attribute_name}...')
+        self.debug('Retrieving value for attribute %s...', attribute_name)
 
         attribute = self.get_attribute(attribute_name)
 
         if attribute:
-            self.debug(f'Value of attribute {attribute_name} is '
-                       f'{attribute.Value}')
+            self.debug('Value of attribute %s is '
+                       '%s', attribute_name, attribute.Value)
             return attribute.Value
 
         self.warning(f'Attribute {attribute_name} was not found in the '
@@ -152,7 +152,7 @@ class DictionaryBackend(ConfigurationBackend):
                        'name.')
             return None
 
-        self.debug(f'Retrieving configuration attribute {attribute_name}...')
+        self.debug('Retrieving configuration attribute %s...', attribute_name)
 
         # Figure out the group to retrieve from
         (group_name, remaining) = self._split_attribute_name(attribute_name)
@@ -165,8 +165,8 @@ class DictionaryBackend(ConfigurationBackend):
         attribute = self._data[group_name].get_attribute(remaining)
 
         if attribute:
-            self.debug(f'Attribute {attribute_name} was retrieved '
-                       f'successfully.')
+            self.debug('Attribute %s was retrieved '
+                       'successfully.', attribute_name)
         else:
             self.warning(f'Attribute {attribute_name} was not found in the '
                          f'configuration.')
@@ -203,7 +203,7 @@ class DictionaryBackend(ConfigurationBackend):
             self.error('Trying to retrieve a group with an invalid name.')
             return None
 
-        self.debug(f'Retrieving configuration group {group_name}...')
+        self.debug('Retrieving configuration group %s...', group_name)
 
         if '.' in group_name:
 
@@ -218,16 +218,16 @@ class DictionaryBackend(ConfigurationBackend):
                 group = self._data[top_level].get_group(remaining)
 
                 if group:
-                    self.debug(f'Configuration group {group_name} was '
-                               f'retrieved.')
+                    self.debug('Configuration group %s was '
+                               'retrieved.', group_name)
                     return group
 
         else:
 
             # Retrieving a top level group.
             if group_name in self._data:
-                self.debug(f'Top level configuration group {group_name} was '
-                           f'retrieved.')
+                self.debug('Top level configuration group %s was '
+                           'retrieved.', group_name)
                 return self._data[group_name]
 
         self.warning(f'Configuration group {group_name} does not exist in the '
@@ -266,7 +266,7 @@ class DictionaryBackend(ConfigurationBackend):
                        'invalid name.')
             return None
 
-        self.debug(f'Retrieving configuration list {list_name}...')
+        self.debug('Retrieving configuration list %s...', list_name)
 
         if '.' in list_name:
 
@@ -281,8 +281,8 @@ class DictionaryBackend(ConfigurationBackend):
                 config_list = self._data[top_level].get_list(remaining)
 
                 if config_list:
-                    self.debug(f'Configuration list {list_name} was '
-                               f'retrieved.')
+                    self.debug('Configuration list %s was '
+                               'retrieved.', list_name)
                     return config_list
 
         self.warning(f'Configuration list {list_name} does not exist in the '
@@ -386,11 +386,11 @@ class DictionaryBackend(ConfigurationBackend):
         if parent is None:
             if not self.has_group(group.Name):
                 self._data[group.Name] = group
-                self.debug(f'New top level configuration group ({group.Name}) '
-                           f'has been added.')
+                self.debug('New top level configuration group (%s) '
+                           'has been added.', group.Name)
             else:
-                self.debug(f'Top level configuration group {group.Name} '
-                           f'already exist, merging...')
+                self.debug('Top level configuration group %s '
+                           'already exist, merging...', group.Name)
                 self.merge_group(group.Name, group)
 
             return
@@ -404,8 +404,8 @@ class DictionaryBackend(ConfigurationBackend):
         parent_group = self.get_group(parent)
         parent_group.add_group(group)
 
-        self.debug(f'Configuration group {group.Name} added under parent '
-                   f'{parent}.')
+        self.debug('Configuration group %s added under parent '
+                   '%s.', group.Name, parent)
 
     def add_list(self, parent: str, config_list: 'ConfigurationList') -> None:
 
@@ -439,8 +439,8 @@ class DictionaryBackend(ConfigurationBackend):
         group = self.get_group(parent)
         group.add_list(config_list)
 
-        self.debug(f'Configuration list {config_list.Name} added under parent '
-                   f'{parent}.')
+        self.debug('Configuration list %s added under parent '
+                   '%s.', config_list.Name, parent)
 
     def add_attribute(self,
                       parent: str,
@@ -477,8 +477,8 @@ class DictionaryBackend(ConfigurationBackend):
         group = self.get_group(parent)
         group.add_attribute(attribute)
 
-        self.debug(f'Configuration attribute {attribute.Name} added under '
-                   f'parent {parent}.')
+        self.debug('Configuration attribute %s added under '
+                   'parent %s.', attribute.Name, parent)
 
     def merge_group(self,
                     group_name: str,
@@ -494,13 +494,13 @@ class DictionaryBackend(ConfigurationBackend):
             Attila Kovacs
         """
 
-        self.debug(f'Merging configuration group {other.Name} into '
-                   f'{group_name}.')
+        self.debug('Merging configuration group %s into '
+                   '%s.', other.Name, group_name)
 
         existing_group = self.get_group(group_name)
 
         if not existing_group:
-            self.debug(f'Target group {group_name} does not exist.')
+            self.debug('Target group %s does not exist.', group_name)
 
             # Get the parent group
             parent, last = group_name.rsplit('.')
@@ -580,7 +580,7 @@ class DictionaryBackend(ConfigurationBackend):
                          f'attribute type is {attribute_obj.Type}.')
             return False
 
-        self.debug(f'Attribute {attribute} can be set to {value}.')
+        self.debug('Attribute %s can be set to %s.', attribute, value)
         return True
 
     def _do_set(self, attribute: str, value: Any) -> None:
@@ -614,8 +614,8 @@ class DictionaryBackend(ConfigurationBackend):
 
         split_name = str.split(name, '.', 1)
 
-        self.debug(f'Input string {name} was split. Identified top level '
-                   f'group: {split_name[0]} Identified attribute: '
-                   f'{split_name[1]}')
+        self.debug('Input string %s was split. Identified top level '
+                   'group: %s Identified attribute: '
+                   '%s', name, split_name[0], split_name[1])
 
         return (split_name[0], split_name[1])
@@ -120,17 +120,17 @@ class EventSystem(LogWriter):
             Attila Kovacs
         """
 
-        self.debug(f'Subscribing to event {event_name}...')
+        self.debug('Subscribing to event %s...', event_name)
 
         # Create a new event handler list if the event is not yet subscribed to
         if not self.has_event(event_name):
             self._events[event_name] = []
-            self.debug(f'Event {event_name} has no subscribers yet, creating '
-                       f'event in the event system.')
+            self.debug('Event %s has no subscribers yet, creating '
+                       'event in the event system.', event_name)
 
         # Add the handler to the handler list
         self._events[event_name].append(cb_handler_function)
-        self.debug(f'Subscribed to {event_name}.')
+        self.debug('Subscribed to %s.', event_name)
 
     def unsubscribe(
         self,
@@ -147,21 +147,21 @@ class EventSystem(LogWriter):
             Attila Kovacs
         """
 
-        self.debug(f'Unsubscribing from {event_name}...')
+        self.debug('Unsubscribing from %s...', event_name)
 
         if not self.has_event(event_name):
-            self.debug(f'Event {event_name} doesn\'t exist, nothing to do.')
+            self.debug('Event %s doesn\'t exist, nothing to do.', event_name)
             return
 
         handlers = self._events[event_name]
         handlers.remove(cb_handler_function)
 
         if len(handlers) == 0:
-            self.debug(f'No handlers left for event {event_name}, removing '
-                       f'the event.')
+            self.debug('No handlers left for event %s, removing '
+                       'the event.', event_name)
             del self._events[event_name]
 
-        self.debug(f'Unsubscribed from {event_name}.')
+        self.debug('Unsubscribed from %s.', event_name)
 
     def send_event(self, event_name: str, *args, **kwargs) -> None:
 
@@ -180,18 +180,18 @@ class EventSystem(LogWriter):
             Attila Kovacs
         """
 
-        self.debug(f'Sending event {event_name} with parameters: '
-                   f'{args} {kwargs}.')
+        self.debug('Sending event %s with parameters: '
+                   '%s %s.', event_name, args, kwargs)
 
         if not self.has_event(event_name):
-            self.debug(f'Event {event_name} has no subscribers yet, nothing '
-                       f'to do.')
+            self.debug('Event %s has no subscribers yet, nothing '
+                       'to do.', event_name)
             return
 
         handlers = self._events[event_name]
-        self.debug(f'Sending event {event_name} to {len(handlers)} '
-                   f'handlers.')
+        self.debug('Sending event %s to %s '
+                   'handlers.', event_name, len(handlers))
         for handler in handlers:
             handler(args, kwargs)
 
-        self.debug(f'Event {event_name} was sent.')
+        self.debug('Event %s was sent.', event_name)
@@ -23,6 +23,8 @@ Contains the log system implementation.
 
 from murasame.log.loglevels import LogLevels
 from murasame.log.logentry import LogEntry
+from murasame.log.logoverflowpolicies import LogOverflowPolicies
+from murasame.log.logqueue import LogQueue
 from murasame.log.logchannel import LogChannel
 from murasame.log.logtarget import LogTarget
 from murasame.log.loggingsystem import LoggingSystem
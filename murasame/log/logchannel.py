@@ -43,6 +43,9 @@ class LogChannel:
 
         _targets (list): List of log targets this channel is writing to.
 
+        _queue (LogQueue): The queue used to write entries asynchronously, or
+            'None' if the channel writes synchronously.
+
         _logger (Logger)
 
     Authors:
@@ -71,13 +74,27 @@ class LogChannel:
 
         return self._default_log_level
 
-    def __init__(self, configuration: dict) -> None:
+    @property
+    def IsAsync(self) -> bool:
+
+        """Whether or not the channel writes its entries asynchronously.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        return self._queue is not None
+
+    def __init__(self, configuration: dict, queue: 'LogQueue' = None) -> None:
 
         """Creates a new log channel instance.
 
         Args:
             configuration (dict): The configuration of the channel.
 
+            queue (LogQueue): Optional log queue to use for writing entries
+                asynchronously.
+
         Authors:
             Attila Kovacs
         """
@@ -85,6 +102,7 @@ class LogChannel:
         self._name = None
         self._default_log_level = None
         self._targets = []
+        self._queue = queue
 
         self._load_configuration(configuration)
 
@@ -102,6 +120,27 @@ class LogChannel:
 
         """Writes a new log entry to the channel.
 
+        In asynchronous mode the entry is only put into the log queue, and it
+        is written to the targets of the channel by the writer thread of the
+        queue.
+
+        Args:
+            entry (LogEntry): The log entry to write.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        if self._queue is not None:
+            self._queue.put(channel=self, entry=entry)
+        else:
+            self.dispatch(entry=entry)
+
+    def dispatch(self, entry: LogEntry) -> None:
+
+        """Sends a log entry to the logger and all targets of the channel on
+        the calling thread.
+
         Args:
             entry (LogEntry): The log entry to write.
 
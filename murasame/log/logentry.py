@@ -21,6 +21,9 @@
 Contains the implementation of the LogEntry class.
 """
 
+# Runtime Imports
+from typing import Callable, Union
+
 class LogEntry:
 
     """Representation of a single log entry.
@@ -30,7 +33,12 @@ class LogEntry:
 
         _timestamp (datetime): The time when the entry has been created.
 
-        _message (str): The actual log message.
+        _message (Union[str, Callable]): The actual log message. Either a
+            format string that is formatted with the arguments of the entry,
+            or a callable that returns the message. The message is only
+            formatted when it is accessed for the first time.
+
+        _args (tuple): Arguments to format the log message with.
 
         _classname (str): Name of the class that sent the message.
 
@@ -65,10 +73,19 @@ class LogEntry:
 
         """The actual log message.
 
+        The message is formatted on first access, so entries that are never
+        written to a target don't pay the cost of formatting.
+
         Authors:
             Attila Kovacs
         """
 
+        if self._args:
+            self._message = self._message % self._args
+            self._args = None
+        elif callable(self._message):
+            self._message = self._message()
+
         return self._message
 
     @property
@@ -85,8 +102,9 @@ class LogEntry:
     def __init__(self,
                  level: 'LogLevels',
                  timestamp: 'datetime',
-                 message: str,
-                 classname: str) -> None:
+                 message: Union[str, Callable],
+                 classname: str,
+                 args: tuple = None) -> None:
 
         """Creates a new LogEntry instance.
 
@@ -95,10 +113,13 @@ class LogEntry:
 
             timestamp (datetime): The time when the entry has been created.
 
-            message (str): The actual log message.
+            message (Union[str, Callable]): The actual log message, or a
+                callable returning the log message.
 
             classname (str): Name of the class that created the log entry.
 
+            args (tuple): Optional arguments to format the message with.
+
         Authors:
             Attila Kovacs
         """
@@ -106,4 +127,5 @@ class LogEntry:
         self._level = level
         self._timestamp = timestamp
         self._message = message
+        self._args = args
         self._classname = classname
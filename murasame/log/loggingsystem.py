@@ -23,6 +23,7 @@ Contains the implementation of the LoggingSystem class.
 
 # Runtime Imports
 import os
+import atexit
 from typing import Union
 
 # Murasame Imports
@@ -30,6 +31,7 @@ from murasame.constants import MURASAME_LOGGING_CONFIG
 from murasame.exceptions import InvalidInputError
 from murasame.utils import JsonFile
 from murasame.log.logchannel import LogChannel
+from murasame.log.logqueue import LogQueue
 from murasame.log.defaultlogconfig import DEFAULT_LOG_CONFIG
 
 class LoggingSystem:
@@ -42,6 +44,9 @@ class LoggingSystem:
         _root_path (str): The root path in the file system where log files are
             written.
 
+        _queue (LogQueue): The queue shared by all channels when asynchronous
+            log is enabled, 'None' otherwise.
+
     Authors:
         Attila Kovacs
     """
@@ -58,6 +63,18 @@ class LoggingSystem:
 
         return  self._root_path
 
+    @property
+    def Queue(self) -> Union[LogQueue, None]:
+
+        """The log queue used in asynchronous mode, or 'None' if the log
+        system writes synchronously.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        return self._queue
+
     def __init__(self) -> None:
 
         """Creates a new LoggingSystem instance.
@@ -76,6 +93,7 @@ class LoggingSystem:
 
         self._channels = {}
         self._root_path = None
+        self._queue = None
 
         if not self._load_configuration():
             self._load_default_configuration()
@@ -114,6 +132,36 @@ class LoggingSystem:
 
         return None
 
+    def flush(self, timeout: float = None) -> None:
+
+        """Waits until all log entries written so far reached their targets.
+
+        Only has an effect in asynchronous mode.
+
+        Args:
+            timeout (float): Maximum time in seconds to wait.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        if self._queue is not None:
+            self._queue.flush(timeout=timeout)
+
+    def shutdown(self) -> None:
+
+        """Writes all pending log entries and stops the asynchronous writer.
+
+        Channels keep working after shutdown, but they write their entries
+        synchronously.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        if self._queue is not None:
+            self._queue.stop()
+
     def _load_configuration(self) -> bool:
 
         """Loads the log configuration from the config file.
@@ -156,6 +204,9 @@ class LoggingSystem:
         if not 'channels' in config:
             return False
 
+        # Set up asynchronous log if it is enabled
+        self._load_queue_configuration(config)
+
         channels = config['channels']
 
         for channel in channels:
@@ -165,7 +216,8 @@ class LoggingSystem:
             channel['__log_root_path__'] = self._root_path
 
             try:
-                log_channel = LogChannel(configuration=channel)
+                log_channel = LogChannel(configuration=channel,
+                                         queue=self._queue)
                 self._channels[log_channel.Name] = log_channel
             except InvalidInputError:
                 # Don't fail if the configuration of a channel is wrong
@@ -173,6 +225,38 @@ class LoggingSystem:
 
         return True
 
+    def _load_queue_configuration(self, config: dict) -> None:
+
+        """Creates the log queue if asynchronous log is enabled in the
+        configuration.
+
+        Args:
+            config (dict): The log configuration.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        try:
+            async_config = config['async']
+        except KeyError:
+            return
+
+        if str(async_config.get('enabled', 'false')).lower() != 'true':
+            return
+
+        try:
+            self._queue = LogQueue(configuration=async_config)
+        except InvalidInputError:
+            # Fall back to synchronous log if the configuration is wrong
+            self._queue = None
+            return
+
+        self._queue.start()
+
+        # Make sure that no log entry is lost when the application exits
+        atexit.register(self.shutdown)
+
     def _load_default_configuration(self) -> None:
 
         """Loads the default log system configuration.
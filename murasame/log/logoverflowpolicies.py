@@ -0,0 +1,52 @@
+## ============================================================================
+##             **** Murasame Application Development Framework ****
+##                Copyright (C) 2019-2021, Suisei Entertainment
+## ============================================================================
+##
+##  Licensed under the Apache License, Version 2.0 (the "License");
+##  you may not use this file except in compliance with the License.
+##  You may obtain a copy of the License at
+##
+##      http://www.apache.org/licenses/LICENSE-2.0
+##
+##  Unless required by applicable law or agreed to in writing, software
+##  distributed under the License is distributed on an "AS IS" BASIS,
+##  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+##  See the License for the specific language governing permissions and
+##  limitations under the License.
+##
+## ============================================================================
+
+
+"""
+Contains the implementation of the LogOverflowPolicies class.
+"""
+
+# Runtime Imports
+from enum import IntEnum, auto
+
+class LogOverflowPolicies(IntEnum):
+
+    """List of supported policies for handling a full asynchronous log queue.
+
+    Attributes:
+        BLOCK: The writing thread waits until there is space in the queue.
+        DROP_OLDEST: The oldest entry in the queue is dropped.
+        DROP_DEBUG: New TRACE and DEBUG entries are dropped, entries with a
+            higher log level block until there is space in the queue.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    BLOCK = auto() # Wait for space in the queue
+    DROP_OLDEST = auto() # Drop the oldest entry in the queue
+    DROP_DEBUG = auto() # Drop new TRACE and DEBUG entries
+
+# Conversion map to use when reading the overflow policy from a string.
+LOG_OVERFLOW_POLICY_CONVERSION_MAP = \
+{
+    'block': LogOverflowPolicies.BLOCK,
+    'drop-oldest': LogOverflowPolicies.DROP_OLDEST,
+    'drop-debug': LogOverflowPolicies.DROP_DEBUG
+}
@@ -0,0 +1,460 @@
+## ============================================================================
+##             **** Murasame Application Development Framework ****
+##                Copyright (C) 2019-2021, Suisei Entertainment
+## ============================================================================
+##
+##  Licensed under the Apache License, Version 2.0 (the "License");
+##  you may not use this file except in compliance with the License.
+##  You may obtain a copy of the License at
+##
+##      http://www.apache.org/licenses/LICENSE-2.0
+##
+##  Unless required by applicable law or agreed to in writing, software
+##  distributed under the License is distributed on an "AS IS" BASIS,
+##  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+##  See the License for the specific language governing permissions and
+##  limitations under the License.
+##
+## ============================================================================
+
+
+"""
+Contains the implementation of the LogQueue class.
+"""
+
+# Runtime Imports
+import os
+import threading
+from collections import deque
+
+# Murasame Imports
+from murasame.exceptions import InvalidInputError
+from murasame.log.loglevels import LogLevels
+from murasame.log.logoverflowpolicies import (
+    LogOverflowPolicies,
+    LOG_OVERFLOW_POLICY_CONVERSION_MAP)
+
+class LogQueue:
+
+    """Bounded queue that decouples log channels from their log targets.
+
+    Log channels running in asynchronous mode only put their entries into the
+    queue, while a background writer thread drains the queue in batches and
+    sends the entries to the logger and the targets of their channel.
+
+    Attributes:
+        _max_size (int): The maximum amount of entries the queue can hold.
+
+        _batch_size (int): The amount of queued entries that wakes up the
+            writer thread before the flush interval elapses.
+
+        _flush_interval (float): The maximum amount of time in seconds an
+            entry can wait in the queue before it's written.
+
+        _overflow_policy (LogOverflowPolicies): What to do with new entries
+            when the queue is full.
+
+        _entries (deque): The queued entries as (channel, entry) pairs.
+
+        _num_pending (int): The amount of entries taken by the writer thread,
+            but not yet written.
+
+        _num_dropped (int): The amount of entries dropped due to overflow.
+
+        _running (bool): Whether or not the writer thread is running.
+
+        _thread (Thread): The writer thread.
+
+        _lock (Lock): Lock protecting the state of the queue.
+
+        _not_empty (Condition): Signaled when the writer thread should wake
+            up.
+
+        _not_full (Condition): Signaled when there is space in the queue.
+
+        _drained (Condition): Signaled when the writer thread has written all
+            queued entries.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    @property
+    def Size(self) -> int:
+
+        """The amount of entries waiting in the queue.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        return len(self._entries)
+
+    @property
+    def MaxSize(self) -> int:
+
+        """The maximum amount of entries the queue can hold.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        return self._max_size
+
+    @property
+    def OverflowPolicy(self) -> LogOverflowPolicies:
+
+        """The policy applied to new entries when the queue is full.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        return self._overflow_policy
+
+    @property
+    def NumDroppedEntries(self) -> int:
+
+        """The amount of log entries dropped because the queue was full.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        return self._num_dropped
+
+    @property
+    def IsRunning(self) -> bool:
+
+        """Whether or not the writer thread is running.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        return self._running
+
+    def __init__(self, configuration: dict) -> None:
+
+        """Creates a new LogQueue instance.
+
+        Args:
+            configuration (dict): The asynchronous log configuration.
+
+        Raises:
+            InvalidInputError: Raised when the configuration contains an
+                invalid value.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        self._max_size = None
+        self._batch_size = None
+        self._flush_interval = None
+        self._overflow_policy = None
+
+        self._load_configuration(configuration)
+
+        self._entries = deque()
+        self._num_pending = 0
+        self._num_dropped = 0
+        self._running = False
+        self._thread = None
+        self._create_locks()
+
+        # The writer thread doesn't survive forking, so restart it in the
+        # child process (e.g. after the application daemonized itself).
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._restart_after_fork)
+
+    def start(self) -> None:
+
+        """Starts the writer thread.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+
+        self._thread = threading.Thread(target=self._run,
+                                        name='LogQueueWriter',
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = None) -> None:
+
+        """Stops the writer thread after all queued entries have been written.
+
+        Entries that are put into the queue after it has been stopped are
+        written synchronously.
+
+        Args:
+            timeout (float): Maximum time in seconds to wait for the writer
+                thread to finish.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+        if self._thread is not None \
+                and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+        self._thread = None
+
+        # Write everything that was left in the queue
+        with self._lock:
+            batch = self._take_batch(len(self._entries))
+
+        self._write_batch(batch)
+
+    def put(self, channel: 'LogChannel', entry: 'LogEntry') -> None:
+
+        """Adds a new log entry to the queue.
+
+        Args:
+            channel (LogChannel): The channel the entry has been written to.
+
+            entry (LogEntry): The log entry to queue.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        # Entries logged by the writer thread itself (e.g. by a log target)
+        # cannot wait for the queue to be drained.
+        if self._thread is threading.current_thread():
+            channel.dispatch(entry)
+            return
+
+        with self._lock:
+
+            while self._running and len(self._entries) >= self._max_size:
+
+                if self._overflow_policy == LogOverflowPolicies.DROP_OLDEST:
+                    self._entries.popleft()
+                    self._num_dropped += 1
+                    break
+
+                if self._overflow_policy == LogOverflowPolicies.DROP_DEBUG \
+                        and entry.LogLevel <= LogLevels.DEBUG:
+                    self._num_dropped += 1
+                    return
+
+                self._not_empty.notify()
+                self._not_full.wait()
+
+            if self._running:
+                self._entries.append((channel, entry))
+                if len(self._entries) >= self._batch_size:
+                    self._not_empty.notify()
+                return
+
+        # The writer thread is not running, write the entry synchronously.
+        channel.dispatch(entry)
+
+    def flush(self, timeout: float = None) -> bool:
+
+        """Waits until all entries queued so far have been written.
+
+        Args:
+            timeout (float): Maximum time in seconds to wait.
+
+        Returns:
+            bool: 'True' if the queue has been drained, 'False' if the timeout
+                elapsed.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        if self._thread is threading.current_thread():
+            return False
+
+        with self._lock:
+
+            if not self._running:
+                return not self._entries
+
+            self._not_empty.notify()
+            return self._drained.wait_for(self._is_drained, timeout=timeout)
+
+    def _run(self) -> None:
+
+        """Main loop of the writer thread.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        while True:
+
+            with self._lock:
+
+                if self._running and len(self._entries) < self._batch_size:
+                    self._not_empty.wait(self._flush_interval)
+
+                if not self._running:
+                    self._drained.notify_all()
+                    return
+
+                batch = self._take_batch(self._batch_size)
+
+            self._write_batch(batch)
+
+            with self._lock:
+                self._num_pending = 0
+                if not self._entries:
+                    self._drained.notify_all()
+
+    def _is_drained(self) -> bool:
+
+        """Returns whether or not all queued entries have been written.
+
+        Has to be called while holding the lock.
+
+        Returns:
+            bool: 'True' if there are no queued or pending entries, or the
+                writer thread has been stopped, 'False' otherwise.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        if not self._running:
+            return True
+
+        return not self._entries and self._num_pending == 0
+
+    def _take_batch(self, size: int) -> list:
+
+        """Removes a batch of entries from the queue.
+
+        Has to be called while holding the lock.
+
+        Args:
+            size (int): The maximum amount of entries to take.
+
+        Returns:
+            list: The list of (channel, entry) pairs taken from the queue.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        batch = []
+
+        while self._entries and len(batch) < size:
+            batch.append(self._entries.popleft())
+
+        self._num_pending = len(batch)
+        self._not_full.notify_all()
+
+        return batch
+
+    @staticmethod
+    def _write_batch(batch: list) -> None:
+
+        """Writes a batch of entries to their channels.
+
+        Args:
+            batch (list): The list of (channel, entry) pairs to write.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        # A failing target must not kill the writer thread.
+        #pylint: disable=broad-except
+
+        for channel, entry in batch:
+            try:
+                channel.dispatch(entry)
+            except Exception:
+                continue
+
+    def _create_locks(self) -> None:
+
+        """Creates the synchronization primitives of the queue.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._drained = threading.Condition(self._lock)
+
+    def _restart_after_fork(self) -> None:
+
+        """Restarts the writer thread in a forked child process.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        was_running = self._running
+
+        # Locks might have been held by a thread that doesn't exist in the
+        # child process anymore.
+        self._create_locks()
+        self._running = False
+        self._thread = None
+        self._num_pending = 0
+
+        if was_running:
+            self.start()
+
+    def _load_configuration(self, configuration: dict) -> None:
+
+        """Loads the configuration of the queue from its serialized format.
+
+        Args:
+            configuration (dict): The asynchronous log configuration.
+
+        Raises:
+            InvalidInputError: Raised when the configuration contains an
+                invalid value.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        try:
+            self._max_size = int(configuration.get('queuesize', 10000))
+            self._batch_size = int(configuration.get('batchsize', 100))
+            self._flush_interval = float(
+                configuration.get('flushinterval', 0.5))
+        except ValueError as exception:
+            raise InvalidInputError(
+                'Invalid value found in the asynchronous log '
+                'configuration.') from exception
+
+        if self._max_size < 1 or self._batch_size < 1 \
+                or self._flush_interval <= 0:
+            raise InvalidInputError(
+                'Queue size, batch size and flush interval of the '
+                'asynchronous log configuration have to be positive.')
+
+        self._batch_size = min(self._batch_size, self._max_size)
+
+        try:
+            self._overflow_policy = LOG_OVERFLOW_POLICY_CONVERSION_MAP[
+                configuration.get('overflowpolicy', 'block').lower()]
+        except KeyError as exception:
+            raise InvalidInputError(
+                f'Unknown log queue overflow policy: '
+                f'{configuration["overflowpolicy"]}') from exception
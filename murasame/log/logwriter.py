@@ -23,6 +23,7 @@ Contains the implementation of the LogWriter class.
 
 # Runtime Imports
 from datetime import datetime
+from typing import Callable, Union
 
 # Murasame Imports
 from murasame.utils.systemlocator import SystemLocator
@@ -33,6 +34,11 @@ class LogWriter:
 
     """Utility class that represents an object that wants to write into the log.
 
+    Log messages can be passed either as a '%'-style format string with its
+    arguments, or as a callable returning the message. In both cases the
+    message is only formatted once it is actually written to a log target, so
+    messages that are filtered out by the log level cost almost nothing.
+
     Attributes:
         _cache_entries (bool): Whether or not log entries should be cached if
             the log service is unavailable.
@@ -173,175 +179,209 @@ class LogWriter:
 
         self._log_writer_suspended = False
 
-    def trace(self, message: str) -> None:
+    def is_enabled_for(self, level: LogLevels) -> bool:
+
+        """Returns whether or not a message with the given log level would be
+        written by this writer.
+
+        Can be used to guard expensive log statements that cannot be expressed
+        as a deferred message.
+
+        Args:
+            level (LogLevels): The log level to check.
+
+        Returns:
+            bool: 'True' if messages with the given log level are written,
+                'False' otherwise.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        if self._log_writer_suspended:
+            return False
+
+        return level == LogLevels.EMERGENCY or self._log_level <= level
+
+    def trace(self, message: Union[str, Callable], *args) -> None:
 
         """Writes a new trace level log message to the log channel, if the
         configured log level allows it.
 
         Args:
-            message (str): The log message to write.
+            message (Union[str, Callable]): The log message to write. Either a
+                '%'-style format string, or a callable returning the message.
+
+            *args: Arguments to format the message with.
 
         Authors:
             Attila Kovacs.
         """
 
-        if self.IsLoggingSuspended:
-            return
+        if self.is_enabled_for(LogLevels.TRACE):
+            self._log(entry=self._make_entry(level=LogLevels.TRACE,
+                                             message=message,
+                                             args=args))
 
-        if self._log_level == LogLevels.TRACE:
-            entry = self._make_entry(level=LogLevels.TRACE, message=message)
-            self._log(entry=entry)
-
-    def debug(self, message: str) -> None:
+    def debug(self, message: Union[str, Callable], *args) -> None:
 
         """Writes a new debug level log message to the log channel, if the
         configured log level allows it.
 
         Args:
-            message (str): The log message to write.
+            message (Union[str, Callable]): The log message to write. Either a
+                '%'-style format string, or a callable returning the message.
+
+            *args: Arguments to format the message with.
 
         Authors:
             Attila Kovacs.
         """
 
-        if self.IsLoggingSuspended:
-            return
+        if self.is_enabled_for(LogLevels.DEBUG):
+            self._log(entry=self._make_entry(level=LogLevels.DEBUG,
+                                             message=message,
+                                             args=args))
 
-        if self._log_level <= LogLevels.DEBUG:
-            entry = self._make_entry(level=LogLevels.DEBUG, message=message)
-            self._log(entry=entry)
-
-    def info(self, message: str) -> None:
+    def info(self, message: Union[str, Callable], *args) -> None:
 
         """Writes a new info level log message to the log channel, if the
         configured log level allows it.
 
         Args:
-            message (str): The log message to write.
+            message (Union[str, Callable]): The log message to write. Either a
+                '%'-style format string, or a callable returning the message.
+
+            *args: Arguments to format the message with.
 
         Authors:
             Attila Kovacs.
         """
 
-        if self.IsLoggingSuspended:
-            return
+        if self.is_enabled_for(LogLevels.INFO):
+            self._log(entry=self._make_entry(level=LogLevels.INFO,
+                                             message=message,
+                                             args=args))
 
-        if self._log_level <= LogLevels.INFO:
-            entry = self._make_entry(level=LogLevels.INFO, message=message)
-            self._log(entry=entry)
-
-    def notice(self, message: str) -> None:
+    def notice(self, message: Union[str, Callable], *args) -> None:
 
         """Writes a new notice level log message to the log channel, if the
         configured log level allows it.
 
         Args:
-            message (str): The log message to write.
+            message (Union[str, Callable]): The log message to write. Either a
+                '%'-style format string, or a callable returning the message.
+
+            *args: Arguments to format the message with.
 
         Authors:
             Attila Kovacs.
         """
 
-        if self.IsLoggingSuspended:
-            return
+        if self.is_enabled_for(LogLevels.NOTICE):
+            self._log(entry=self._make_entry(level=LogLevels.NOTICE,
+                                             message=message,
+                                             args=args))
 
-        if self._log_level <= LogLevels.NOTICE:
-            entry = self._make_entry(level=LogLevels.NOTICE, message=message)
-            self._log(entry=entry)
-
-    def warning(self, message: str) -> None:
+    def warning(self, message: Union[str, Callable], *args) -> None:
 
         """Writes a new warning level log message to the log channel, if the
         configured log level allows it.
 
         Args:
-            message (str): The log message to write.
+            message (Union[str, Callable]): The log message to write. Either a
+                '%'-style format string, or a callable returning the message.
+
+            *args: Arguments to format the message with.
 
         Authors:
             Attila Kovacs.
         """
 
-        if self.IsLoggingSuspended:
-            return
+        if self.is_enabled_for(LogLevels.WARNING):
+            self._log(entry=self._make_entry(level=LogLevels.WARNING,
+                                             message=message,
+                                             args=args))
 
-        if self._log_level <= LogLevels.WARNING:
-            entry = self._make_entry(level=LogLevels.WARNING, message=message)
-            self._log(entry=entry)
-
-    def error(self, message: str) -> None:
+    def error(self, message: Union[str, Callable], *args) -> None:
 
         """Writes a new error level log message to the log channel, if the
         configured log level allows it.
 
         Args:
-            message (str): The log message to write.
+            message (Union[str, Callable]): The log message to write. Either a
+                '%'-style format string, or a callable returning the message.
+
+            *args: Arguments to format the message with.
 
         Authors:
             Attila Kovacs.
         """
 
-        if self.IsLoggingSuspended:
-            return
+        if self.is_enabled_for(LogLevels.ERROR):
+            self._log(entry=self._make_entry(level=LogLevels.ERROR,
+                                             message=message,
+                                             args=args))
 
-        if self._log_level <= LogLevels.ERROR:
-            entry = self._make_entry(level=LogLevels.ERROR, message=message)
-            self._log(entry=entry)
-
-    def critical(self, message: str) -> None:
+    def critical(self, message: Union[str, Callable], *args) -> None:
 
         """Writes a new critical level log message to the log channel, if the
         configured log level allows it.
 
         Args:
-            message (str): The log message to write.
+            message (Union[str, Callable]): The log message to write. Either a
+                '%'-style format string, or a callable returning the message.
+
+            *args: Arguments to format the message with.
 
         Authors:
             Attila Kovacs.
         """
 
-        if self.IsLoggingSuspended:
-            return
+        if self.is_enabled_for(LogLevels.CRITICAL):
+            self._log(entry=self._make_entry(level=LogLevels.CRITICAL,
+                                             message=message,
+                                             args=args))
 
-        if self._log_level <= LogLevels.CRITICAL:
-            entry = self._make_entry(level=LogLevels.CRITICAL, message=message)
-            self._log(entry=entry)
-
-    def alert(self, message: str) -> None:
+    def alert(self, message: Union[str, Callable], *args) -> None:
 
         """Writes a new alert level log message to the log channel, if the
         configured log level allows it.
 
         Args:
-            message (str): The log message to write.
+            message (Union[str, Callable]): The log message to write. Either a
+                '%'-style format string, or a callable returning the message.
+
+            *args: Arguments to format the message with.
 
         Authors:
             Attila Kovacs.
         """
 
-        if self.IsLoggingSuspended:
-            return
+        if self.is_enabled_for(LogLevels.ALERT):
+            self._log(entry=self._make_entry(level=LogLevels.ALERT,
+                                             message=message,
+                                             args=args))
 
-        if self._log_level <= LogLevels.ALERT:
-            entry = self._make_entry(level=LogLevels.ALERT, message=message)
-            self._log(entry=entry)
-
-    def emergency(self, message: str) -> None:
+    def emergency(self, message: Union[str, Callable], *args) -> None:
 
         """Writes a new emergency level log message to the log channel, if the
         configured log level allows it.
 
         Args:
-            message (str): The log message to write.
+            message (Union[str, Callable]): The log message to write. Either a
+                '%'-style format string, or a callable returning the message.
+
+            *args: Arguments to format the message with.
 
         Authors:
             Attila Kovacs.
         """
 
-        if self.IsLoggingSuspended:
-            return
-
-        entry = self._make_entry(level=LogLevels.EMERGENCY, message=message)
-        self._log(entry=entry)
+        if self.is_enabled_for(LogLevels.EMERGENCY):
+            self._log(entry=self._make_entry(level=LogLevels.EMERGENCY,
+                                             message=message,
+                                             args=args))
 
     def _log(self, entry: LogEntry) -> None:
 
@@ -402,14 +442,20 @@ class LogWriter:
 
         return channel
 
-    def _make_entry(self, level: LogLevels, message: str) -> LogEntry:
+    def _make_entry(
+        self,
+        level: LogLevels,
+        message: Union[str, Callable],
+        args: tuple = None) -> LogEntry:
 
         """Creates a new log entry.
 
         Args:
             level (LogLevels): The log level the message was sent with.
 
-            message (str): The log message.
+            message (Union[str, Callable]): The log message.
+
+            args (tuple): Arguments to format the log message with.
 
         Authors:
             Attila Kovacs
@@ -418,7 +464,8 @@ class LogWriter:
         return LogEntry(level=level,
                         timestamp=datetime.utcnow(),
                         message=message,
-                        classname=self.__class__.__name__)
+                        classname=self.__class__.__name__,
+                        args=args)
 
     def _cache_entry(self, entry: LogEntry) -> None:
 
@@ -253,7 +253,6 @@ class HostLocation(LogWriter):
                         
                     
                     safe_extract(tar, path=PACKAGE_DOWNLOAD_LOCATION, members=GeoIP._find_mmdb(tar))
-                                   members=GeoIP._find_mmdb(tar))
 
                 # Move the database to the requested location
                 shutil.move(src=f'{PACKAGE_DOWNLOAD_LOCATION}/GeoLite2-City.mmdb',
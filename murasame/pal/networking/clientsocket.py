@@ -161,7 +161,7 @@ class ClientSocket(BaseSocket):
 
         # Set new host is requested
         if new_host is not None:
-            self.debug(f'Changing host from {self._host} to {new_host}.')
+            self.debug('Changing host from %s to %s.', self._host, new_host)
             self._host = new_host
 
         # Set new port if requested
@@ -175,13 +175,13 @@ class ClientSocket(BaseSocket):
                     f'connect(){new_port}. Error: {exception.errormessage}. '
                     f'New port is ignored.')
 
-        self.debug(f'Connecting to {self._host}:{self._port}...')
+        self.debug('Connecting to %s:%s...', self._host, self._port)
 
         # Disconnect the previous connection if the socket is already connected
         if self.IsConnected:
             self.debug(
-                f'Socket is already connected to {self._host}:{self._port}. '
-                f'Disconnecting...')
+                'Socket is already connected to %s:%s. '
+                'Disconnecting...', self._host, self._port)
             self.disconnect()
 
         # Establish the connection
@@ -193,7 +193,7 @@ class ClientSocket(BaseSocket):
                        f'Reason: {socket_error}.')
             return
 
-        self.debug(f'Connection established to {self._host}:{self._port}.')
+        self.debug('Connection established to %s:%s.', self._host, self._port)
 
     def disconnect(self) -> None:
 
@@ -204,7 +204,7 @@ class ClientSocket(BaseSocket):
         """
 
         if self.IsConnected:
-            self.debug(f'Disconnecting from {self._host}:{self._port}.')
+            self.debug('Disconnecting from %s:%s.', self._host, self._port)
             self._socket.close()
             self._connected = False
 
@@ -232,8 +232,8 @@ class ClientSocket(BaseSocket):
             self._socket.sendall(raw_message, message_size)
             self.increase_bytes_sent(bytes_sent=message_size)
             self.debug(
-                f'Sending message {raw_message}  ({message_size} bytes) over '
-                f'socket {self.Name}.')
+                'Sending message %s  (%s bytes) over '
+                'socket %s.', raw_message, message_size, self.Name)
         except socket.error:
             self.error(
                 f'Failed to send message {str(raw_message)} over socket '
@@ -268,8 +268,8 @@ class ClientSocket(BaseSocket):
         else:
             message = raw_message
 
-        self.debug(f'Received message {message} ({message_size} bytes) over '
-                   f'socket {self.Name}.')
+        self.debug('Received message %s (%s bytes) over '
+                   'socket %s.', message, message_size, self.Name)
 
         return message
 
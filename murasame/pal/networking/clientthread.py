@@ -149,7 +149,7 @@ class ClientThread(Thread):
             cache_entries=True)
 
         self._logger.debug(
-            f'Created client handler for {self.IPAddress}:{self.Port}.')
+            'Created client handler for %s:%s.', self.IPAddress, self.Port)
 
     def abort(self) -> None:
 
@@ -181,8 +181,9 @@ class ClientThread(Thread):
                 self._parent_socket.increase_bytes_received(
                     bytes_received=message_size)
                 self._logger.debug(
-                    f'Received data from {self.IPAddress}:{self.Port}. '
-                    f'Raw data: {str(raw_data)} ({message_size} bytes)')
+                    'Received data from %s:%s. '
+                    'Raw data: %s (%s bytes)',
+                    self.IPAddress, self.Port, raw_data, message_size)
             except socket.error as socket_error:
                 self._logger.error(
                     f'Failed to receive message from client '
@@ -192,8 +193,8 @@ class ClientThread(Thread):
             if not raw_data:
                 self.abort()
                 self._logger.debug(
-                    f'Connection to {self.IPAddress}:{self.Port} has been '
-                    f'closed.')
+                    'Connection to %s:%s has been '
+                    'closed.', self.IPAddress, self.Port)
                 self.on_abort()
                 return
 
@@ -228,8 +229,9 @@ class ClientThread(Thread):
             self.Connection.sendall(raw_message, message_size)
             self._parent_socket.increase_bytes_sent(message_size)
             self._logger.debug(
-                f'Sending message {raw_message}  ({message_size} bytes) over '
-                f'socket {self._parent_socket.Name}.')
+                'Sending message %s  (%s bytes) over '
+                'socket %s.',
+                raw_message, message_size, self._parent_socket.Name)
         except socket.error:
             self._logger.error(
                 f'Failed to send message {str(raw_message)} over socket '
@@ -109,10 +109,10 @@ class VFS(LogWriter):
                        'system.')
             return
 
-        self.debug(f'Adding node {node.Name} to the virtual file system...')
+        self.debug('Adding node %s to the virtual file system...', node.Name)
 
         if parent != '':
-            self.debug(f'Adding node {node.Name} to parent {parent}...')
+            self.debug('Adding node %s to parent %s...', node.Name, parent)
             parent = self.get_node(key=parent)
             if not parent:
                 self.error(f'The virtual file system doesn\'t have a not with '
@@ -121,17 +121,17 @@ class VFS(LogWriter):
                 return
             parent.add_node(node=node)
         elif self.has_node(name=node.Name):
-            self.debug(f'The virtual file system already has a node with name '
-                       f'{node.Name}, merging the new node into it.')
+            self.debug('The virtual file system already has a node with name '
+                       '%s, merging the new node into it.', node.Name)
             existing_node = self.get_node(key=node.Name)
             existing_node.merge_with(node=node)
         else:
-            self.debug(f'Adding node {node.Name} to the root of the virtual '
-                       f'file system.')
+            self.debug('Adding node %s to the root of the virtual '
+                       'file system.', node.Name)
             self._root.add_node(node=node)
 
-        self.debug(f'Node {node.Name} has been added to the virtual file '
-                   f'system.')
+        self.debug('Node %s has been added to the virtual file '
+                   'system.', node.Name)
 
     def remove_node(self, node_name: str) -> None:
 
@@ -145,11 +145,11 @@ class VFS(LogWriter):
         """
 
         self.debug(
-            f'Removing node {node_name} from the virtual file system...')
+            'Removing node %s from the virtual file system...', node_name)
 
         if not self.has_node(node_name):
-            self.debug(f'The virtual file system doesn\'t have a node with '
-                       f'name {node_name}.')
+            self.debug('The virtual file system doesn\'t have a node with '
+                       'name %s.', node_name)
             return
 
         self._root.remove_node(name=node_name)
@@ -168,7 +168,7 @@ class VFS(LogWriter):
             Attila Kovacs
         """
 
-        self.debug(f'Retrieving VFS node {key}...')
+        self.debug('Retrieving VFS node %s...', key)
         return self._root.get_node(name=key)
 
     def get_content(self, key: str, version: 'ResourceVersion' = None) -> Any:
@@ -188,7 +188,7 @@ class VFS(LogWriter):
             Attila Kovacs
         """
 
-        self.debug(f'Retrieving VFS resource {key}({version})...')
+        self.debug('Retrieving VFS resource %s(%s)...', key, version)
 
         node = self._root.get_node(name=key)
 
@@ -204,7 +204,7 @@ class VFS(LogWriter):
                        f'version for {key}(version {version}).')
             return None
 
-        self.debug(f'Found resource for {key}(version {version}).')
+        self.debug('Found resource for %s(version %s).', key, version)
         return resource.Resource
 
     def register_source(self, path: str) -> None:
@@ -227,7 +227,7 @@ class VFS(LogWriter):
         # Normalize path
         path = os.path.abspath(os.path.expanduser(path))
 
-        self.debug(f'Registering {path} as a VFS data source...')
+        self.debug('Registering %s as a VFS data source...', path)
 
         # Load the source based on its type
         if os.path.isdir(path):
@@ -258,11 +258,11 @@ class VFS(LogWriter):
             Attila Kovacs
         """
 
-        self.debug(f'Checking the existence of node {name}...')
+        self.debug('Checking the existence of node %s...', name)
 
         if not self._root:
-            self.debug(f'Node {name} doesn\'t exist in the virtual file '
-                       f'system.')
+            self.debug('Node %s doesn\'t exist in the virtual file '
+                       'system.', name)
             return False
 
         return  self._root.has_node(name=name)
@@ -293,11 +293,11 @@ class VFS(LogWriter):
         """
 
         if recursive:
-            self.debug(f'Retrieving all file nodes from VFS directory node '
-                       f'{node_name} and subdirectories...')
+            self.debug('Retrieving all file nodes from VFS directory node '
+                       '%s and subdirectories...', node_name)
         else:
-            self.debug(f'Retrieving all file nodes from VFS directory node '
-                       f'{node_name}...')
+            self.debug('Retrieving all file nodes from VFS directory node '
+                       '%s...', node_name)
 
         if not self._root:
             self.error(f'Node {node_name} doesn\'t exist in the virtual file '
@@ -361,8 +361,8 @@ class VFS(LogWriter):
             Attila Kovacs
         """
 
-        self.debug(f'Registering new data source from resource package '
-                   f'{path}...')
+        self.debug('Registering new data source from resource package '
+                   '%s...', path)
 
         package = VFSPackage(path=path)
         self._packages[package.Path] = package
@@ -395,6 +395,6 @@ class VFS(LogWriter):
             Attila Kovacs
         """
 
-        self.debug(f'Adding the contents of directory {path} to the VFS...')
+        self.debug('Adding the contents of directory %s to the VFS...', path)
         self._root.populate_from_directory(path=path)
-        self.debug(f'Contents of directory {path} has been added to VFS.')
+        self.debug('Contents of directory %s has been added to VFS.', path)
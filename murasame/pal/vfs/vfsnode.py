@@ -212,13 +212,13 @@ class VFSNode(LogWriter):
             Attila Kovacs
         """
 
-        self.debug(f'Resetting node {self.Name}...')
+        self.debug('Resetting node %s...', self.Name)
 
         self.remove_all_subdirectories()
         self.remove_all_files()
         self.remove_all_resources()
 
-        self.debug(f'Reset of node {self.Name} was completed.')
+        self.debug('Reset of node %s was completed.', self.Name)
 
     def is_dir(self) -> bool:
 
@@ -314,16 +314,16 @@ class VFSNode(LogWriter):
             return
 
         if self.has_node(node.Name):
-            self.debug(f'Node {self.Name} already has a child with name '
-                       f'{node.Name}, attempting to merge...')
+            self.debug('Node %s already has a child with name '
+                       '%s, attempting to merge...', self.Name, node.Name)
             self.get_node(node.Name).merge_with(node)
         elif node.Type == VFSNodeTypes.DIRECTORY:
-            self.debug(f'Adding new subdirectory node {node.Name} to '
-                       f'node {self.Name}.')
+            self.debug('Adding new subdirectory node %s to '
+                       'node %s.', node.Name, self.Name)
             self._directories[node.Name] = node
         else:
-            self.debug(f'Adding new file node {node.Name} to '
-                       f'node {self.Name}.')
+            self.debug('Adding new file node %s to '
+                       'node %s.', node.Name, self.Name)
             self._files[node.Name] = node
 
     def remove_node(self, name: str) -> None:
@@ -337,11 +337,11 @@ class VFSNode(LogWriter):
             Attila Kovacs
         """
 
-        self.debug(f'Removing child node {name} from node {self.Name}...')
+        self.debug('Removing child node %s from node %s...', name, self.Name)
 
         if not self.has_node(name=name):
-            self.debug(f'Node {self.Name} doesn\'t have a child node named '
-                       f'{name}, nothing to remove.')
+            self.debug('Node %s doesn\'t have a child node named '
+                       '%s, nothing to remove.', self.Name, name)
             return
 
         if name in self._directories:
@@ -360,15 +360,15 @@ class VFSNode(LogWriter):
             Attila Kovacs
         """
 
-        self.debug(f'Removing subdirectory {name} from node {self.Name}...')
+        self.debug('Removing subdirectory %s from node %s...', name, self.Name)
 
         try:
             del self._directories[name]
-            self.debug(f'Subdirectory {name} has been deleted from node '
-                       f'{self.Name}.')
+            self.debug('Subdirectory %s has been deleted from node '
+                       '%s.', name, self.Name)
         except KeyError:
-            self.debug(f'Node {self.Name} doesn\'t have a subdirectory named '
-                      f'{name}, nothing to do.')
+            self.debug('Node %s doesn\'t have a subdirectory named '
+                      '%s, nothing to do.', self.Name, name)
 
     def remove_all_subdirectories(self) -> None:
 
@@ -378,13 +378,13 @@ class VFSNode(LogWriter):
             Attila Kovacs
         """
 
-        self.debug(f'Removing all directory nodes from node {self.Name}...')
+        self.debug('Removing all directory nodes from node %s...', self.Name)
 
         del self._directories
         self._directories = {}
 
         self.debug(
-            f'All directory nodes has been removed from node {self.Name}.')
+            'All directory nodes has been removed from node %s.', self.Name)
 
     def remove_file(self, name: str) -> None:
 
@@ -397,14 +397,15 @@ class VFSNode(LogWriter):
             Attila Kovacs
         """
 
-        self.debug(f'Removing file {name} from node {self.Name}...')
+        self.debug('Removing file %s from node %s...', name, self.Name)
 
         try:
             del self._files[name]
-            self.debug(f'File {name} has been deleted from node {self.Name}.')
+            self.debug('File %s has been deleted from node %s.',
+                       name, self.Name)
         except KeyError:
-            self.debug(f'Node {self.Name} doesn\'t have a file named {name}, '
-                       f'nothing to do.')
+            self.debug('Node %s doesn\'t have a file named %s, '
+                       'nothing to do.', self.Name, name)
 
     def remove_all_files(self) -> None:
 
@@ -414,12 +415,12 @@ class VFSNode(LogWriter):
             Attila Kovacs
         """
 
-        self.debug(f'Removing all file nodes from node {self.Name}...')
+        self.debug('Removing all file nodes from node %s...', self.Name)
 
         del self._files
         self._files = {}
 
-        self.debug(f'All file nodes has been removed from node {self.Name}.')
+        self.debug('All file nodes has been removed from node %s.', self.Name)
 
     def get_node(self, name: str) -> Union['VFSNode', None]:
 
@@ -465,7 +466,7 @@ class VFSNode(LogWriter):
             Attila Kovacs
         """
 
-        self.debug(f'Attempting to merge {node.Name} into {self.Name}...')
+        self.debug('Attempting to merge %s into %s...', node.Name, self.Name)
 
         if self.Type != node.Type:
             self.error(f'The type of {node.Name} doesn\'t match the type of '
@@ -475,20 +476,21 @@ class VFSNode(LogWriter):
 
         if self.Type == VFSNodeTypes.FILE:
             self.debug(
-                f'Merging resources from {node.Name} into {self.Name}...')
+                'Merging resources from %s into %s...', node.Name, self.Name)
             for resource in node.Resources:
                 self.add_resource(resource)
         else:
             self.debug(
-                f'Merging subdirectories from {node.Name} into {self.Name}...')
+                'Merging subdirectories from %s into %s...',
+                node.Name, self.Name)
             for dummy, directory in node.Subdirectories.items():
                 self.add_node(directory)
             self.debug(
-                f'Merging files from {node.Name} into {self.Name}...')
+                'Merging files from %s into %s...', node.Name, self.Name)
             for dummy, file in node.Files.items():
                 self.add_node(file)
 
-        self.debug(f'{node.Name} has been merged into {self.Name}.')
+        self.debug('%s has been merged into %s.', node.Name, self.Name)
 
     def get_resource(
         self,
@@ -565,8 +567,8 @@ class VFSNode(LogWriter):
             Attila Kovacs
         """
 
-        self.debug(f'Adding new resource to VFS node {self.Name}...')
-        self.trace(f'VFS resource: {resource.Descriptor}')
+        self.debug('Adding new resource to VFS node %s...', self.Name)
+        self.trace('VFS resource: %s', resource.Descriptor)
 
         # Directory nodes don't have resources
         if self._type == VFSNodeTypes.DIRECTORY:
@@ -588,7 +590,7 @@ class VFSNode(LogWriter):
             self._resources.sort(key=lambda x: x.Version,
                              reverse=True)
 
-        self.debug(f'New VFS resource has been added to node {self.Name}.')
+        self.debug('New VFS resource has been added to node %s.', self.Name)
 
     def remove_resource(self, version: int = None) -> None:
 
@@ -602,15 +604,15 @@ class VFSNode(LogWriter):
         """
 
         self.debug(
-            f'Removing resource version {version} from node {self.Name}...')
+            'Removing resource version %s from node %s...', version, self.Name)
 
         resource = self.get_resource(version=version)
         if resource:
             self._resources.remove(resource)
-            self.debug(f'Resource v{version} was removed from {self.Name}.')
+            self.debug('Resource v%s was removed from %s.', version, self.Name)
         else:
-            self.debug(f'Node {self.Name} doesn\'t have a resource with '
-                       f'version {version}, nothing to remove.')
+            self.debug('Node %s doesn\'t have a resource with '
+                       'version %s, nothing to remove.', self.Name, version)
 
     def remove_all_resources(self) -> None:
 
@@ -620,12 +622,12 @@ class VFSNode(LogWriter):
             Attila Kovacs
         """
 
-        self.debug(f'Removing all resources from node {self.Name}...')
+        self.debug('Removing all resources from node %s...', self.Name)
 
         del self._resources
         self._resources = []
 
-        self.debug(f'All resources removed from node {self.Name}.')
+        self.debug('All resources removed from node %s.', self.Name)
 
     def serialize(self) -> dict:
 
@@ -638,7 +640,7 @@ class VFSNode(LogWriter):
             Attila Kovacs
         """
 
-        self.debug(f'Serializing VFS node {self.Name}...')
+        self.debug('Serializing VFS node %s...', self.Name)
 
         result = {}
         result['name'] = self.Name
@@ -676,8 +678,8 @@ class VFSNode(LogWriter):
 
             result['resource'] = resources
 
-        self.debug(f'Node {self.Name} has been serialized.')
-        self.trace(f'Node {self.Name}: {result}')
+        self.debug('Node %s has been serialized.', self.Name)
+        self.trace('Node %s: %s', self.Name, result)
 
         return result
 
@@ -693,7 +695,7 @@ class VFSNode(LogWriter):
         """
 
         self.debug('Deserializing node...')
-        self.trace(f'Data: {data}')
+        self.trace('Data: %s', data)
 
         if not isinstance(data, dict):
             raise InvalidInputError('Trying to deserialize invalid data.')
@@ -718,7 +720,7 @@ class VFSNode(LogWriter):
 
         if node_type == 'directory':
 
-            self.debug(f'Deserializing {self.Name} as a directory node...')
+            self.debug('Deserializing %s as a directory node...', self.Name)
             self._type = VFSNodeTypes.DIRECTORY
 
             subdirectories = None
@@ -728,7 +730,7 @@ class VFSNode(LogWriter):
             try:
                 subdirectories = data['subdirectories']
             except KeyError:
-                self.debug(f'No subdirectories found for {self.Name}.')
+                self.debug('No subdirectories found for %s.', self.Name)
 
             for name, subdirectory in subdirectories.items():
                 node = VFSNode(node_name=name)
@@ -739,7 +741,7 @@ class VFSNode(LogWriter):
             try:
                 files = data['files']
             except KeyError:
-                self.debug(f'No files found for {self.Name}.')
+                self.debug('No files found for %s.', self.Name)
 
             for name, file in files.items():
                 node = VFSNode(node_name=name)
@@ -748,7 +750,7 @@ class VFSNode(LogWriter):
 
         else:
 
-            self.debug(f'Deserializing {self.Name} as a file node...')
+            self.debug('Deserializing %s as a file node...', self.Name)
             self._type = VFSNodeTypes.FILE
 
             resources = None
@@ -757,7 +759,7 @@ class VFSNode(LogWriter):
             try:
                 resources = data['resource']
             except KeyError:
-                self.debug(f'No resources found for {self.Name}.')
+                self.debug('No resources found for %s.', self.Name)
 
             for resource in resources:
                 try:
@@ -776,7 +778,7 @@ class VFSNode(LogWriter):
 
                 self.add_resource(res)
 
-        self.debug(f'Node deserialization complete for {self.Name}.')
+        self.debug('Node deserialization complete for %s.', self.Name)
 
     def get_all_files(
             self,
@@ -844,13 +846,14 @@ class VFSNode(LogWriter):
             Attila Kovacs
         """
 
-        self.debug(f'Adding subdirectory {name}({path}) under node '
-                   f'{self.Name}...')
+        self.debug('Adding subdirectory %s(%s) under node '
+                   '%s...', name, path, self.Name)
 
         node = VFSNode(node_name=name)
         node.populate_from_directory(path=path)
         self.add_node(node)
-        self.debug(f'Subdirectory {name} has been added to node {self.Name}.')
+        self.debug('Subdirectory %s has been added to node %s.',
+                   name, self.Name)
 
     def _add_file_from_directory(self, name: str, path: str) -> None:
 
@@ -865,7 +868,7 @@ class VFSNode(LogWriter):
             Attila Kovacs
         """
 
-        self.debug(f'Adding file {name}({path}) to node {self.Name}...')
+        self.debug('Adding file %s(%s) to node %s...', name, path, self.Name)
 
         # Create a file node based on the file path and mark it as the latest
         # version of that file so it won't be overwritten by anything coming
@@ -887,4 +890,4 @@ class VFSNode(LogWriter):
 
         self.add_node(node)
 
-        self.debug(f'File {name} has been added to node {self.Name}.')
+        self.debug('File %s has been added to node %s.', name, self.Name)
@@ -25,3 +25,4 @@ Contains the test data for the CLI tests.
 from test.constants import TEST_FILES_DIRECTORY
 
 def create_cli_data():
+    pass
@@ -53,7 +53,10 @@ def download_geoip_database():
         Attila Kovacs
     """
 
-    wget.download(url=GEOIP_DOWNLOAD_URL, out=DATABASE_PACKAGE_PATH)
+    try:
+        wget.download(url=GEOIP_DOWNLOAD_URL, out=DATABASE_PACKAGE_PATH)
+    except Exception:
+        return
     tar = tarfile.open(DATABASE_PACKAGE_PATH)
     tar.extractall(path='/tmp', members=find_mmdb(tar))
     tar.close()
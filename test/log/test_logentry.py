@@ -64,3 +64,22 @@ class TestLogEntry:
         assert sut.Timestamp == timestamp
         assert sut.Message == 'test'
         assert sut.Classname == self.__class__.__name__
+
+    def test_message_formatting(self):
+
+        """
+        Tests that the message of a log entry is formatted with its arguments
+        on access.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        sut = LogEntry(level=LogLevels.DEBUG,
+                       timestamp=datetime.datetime.now(),
+                       message='test %s',
+                       classname=self.__class__.__name__,
+                       args=('message',))
+
+        assert sut.Message == 'test message'
+        assert sut.Message == 'test message'
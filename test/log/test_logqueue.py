@@ -0,0 +1,218 @@
+## ============================================================================
+##             **** Murasame Application Development Framework ****
+##                Copyright (C) 2019-2021, Suisei Entertainment
+## ============================================================================
+##
+##  Licensed under the Apache License, Version 2.0 (the "License");
+##  you may not use this file except in compliance with the License.
+##  You may obtain a copy of the License at
+##
+##      http://www.apache.org/licenses/LICENSE-2.0
+##
+##  Unless required by applicable law or agreed to in writing, software
+##  distributed under the License is distributed on an "AS IS" BASIS,
+##  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+##  See the License for the specific language governing permissions and
+##  limitations under the License.
+##
+## ============================================================================
+
+"""
+Contains the unit tests of the LogQueue class.
+"""
+
+# Runtime Imports
+import os
+import sys
+import datetime
+import threading
+
+# Dependency Imports
+import pytest
+
+# Fix paths to make framework modules accessible
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+# Murasame Imports
+from murasame.exceptions import InvalidInputError
+from murasame.log import LogChannel, LogEntry, LogLevels, LogQueue
+from murasame.log import LogOverflowPolicies
+
+class ChannelTester:
+    def __init__(self, block: bool = False):
+        self.entries = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        if not block:
+            self.release.set()
+    def dispatch(self, entry):
+        self.started.set()
+        self.release.wait()
+        self.entries.append(entry.Message)
+
+def create_entry(message: str, level: LogLevels = LogLevels.INFO) -> LogEntry:
+    return LogEntry(level=level,
+                    timestamp=datetime.datetime.utcnow(),
+                    message=message,
+                    classname='TestLogQueue')
+
+class TestLogQueue:
+
+    """
+    Contains all unit tests of the LogQueue class.
+
+    Authors:
+        Attila Kovacs
+    """
+
+    def test_creation(self):
+
+        """
+        Tests that a log queue can be created.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        sut = LogQueue(configuration={'queuesize': '10',
+                                      'overflowpolicy': 'drop-oldest'})
+        assert sut.MaxSize == 10
+        assert sut.OverflowPolicy == LogOverflowPolicies.DROP_OLDEST
+        assert not sut.IsRunning
+
+    def test_creation_with_invalid_configuration(self):
+
+        """
+        Tests that a log queue cannot be created with an invalid
+        configuration.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        with pytest.raises(InvalidInputError):
+            LogQueue(configuration={'overflowpolicy': 'unknown'})
+
+        with pytest.raises(InvalidInputError):
+            LogQueue(configuration={'queuesize': '0'})
+
+    def test_entries_are_written_in_order(self):
+
+        """
+        Tests that queued entries are written in order by the writer thread.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        channel = ChannelTester()
+        sut = LogQueue(configuration={'batchsize': '3'})
+        sut.start()
+
+        for index in range(10):
+            sut.put(channel=channel, entry=create_entry(f'{index}'))
+
+        assert sut.flush(timeout=5)
+        assert channel.entries == [f'{index}' for index in range(10)]
+        sut.stop()
+
+    def test_stop_writes_pending_entries(self):
+
+        """
+        Tests that stopping the queue writes all pending entries, and entries
+        are written synchronously after that.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        channel = ChannelTester()
+        sut = LogQueue(configuration={'flushinterval': '60'})
+        sut.start()
+        sut.put(channel=channel, entry=create_entry('first'))
+        sut.stop()
+        assert channel.entries == ['first']
+
+        sut.put(channel=channel, entry=create_entry('second'))
+        assert channel.entries == ['first', 'second']
+
+    def test_drop_oldest_policy(self):
+
+        """
+        Tests that the oldest entry is dropped when the queue is full and the
+        drop-oldest policy is used.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        channel = ChannelTester(block=True)
+        sut = LogQueue(configuration={'queuesize': '2',
+                                      'batchsize': '1',
+                                      'overflowpolicy': 'drop-oldest'})
+        sut.start()
+
+        # Wait for the writer to block on the first entry
+        sut.put(channel=channel, entry=create_entry('0'))
+        assert channel.started.wait(timeout=5)
+
+        for index in range(1, 4):
+            sut.put(channel=channel, entry=create_entry(f'{index}'))
+
+        assert sut.NumDroppedEntries == 1
+
+        channel.release.set()
+        assert sut.flush(timeout=5)
+        assert channel.entries == ['0', '2', '3']
+        sut.stop()
+
+    def test_drop_debug_policy(self):
+
+        """
+        Tests that new debug entries are dropped when the queue is full and
+        the drop-debug policy is used.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        channel = ChannelTester(block=True)
+        sut = LogQueue(configuration={'queuesize': '1',
+                                      'batchsize': '1',
+                                      'overflowpolicy': 'drop-debug'})
+        sut.start()
+
+        sut.put(channel=channel, entry=create_entry('0'))
+        assert channel.started.wait(timeout=5)
+
+        sut.put(channel=channel, entry=create_entry('1'))
+        sut.put(channel=channel,
+                entry=create_entry('2', level=LogLevels.DEBUG))
+        assert sut.NumDroppedEntries == 1
+
+        channel.release.set()
+        assert sut.flush(timeout=5)
+        assert channel.entries == ['0', '1']
+        sut.stop()
+
+    def test_async_channel(self):
+
+        """
+        Tests that a log channel writes through the queue in asynchronous
+        mode.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        queue = LogQueue(configuration={})
+        channel = LogChannel(configuration={'name': 'testchannel',
+                                            'targets': []},
+                             queue=queue)
+        assert channel.IsAsync
+
+        queue.start()
+        channel.write(entry=create_entry('test'))
+        assert queue.flush(timeout=5)
+        assert queue.Size == 0
+        queue.stop()
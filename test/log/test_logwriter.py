@@ -688,3 +688,77 @@ class TestLogWriter:
         sut = LogWriter(channel_name='test', cache_entries=True)
         sut.resume_logging()
         assert not sut.IsLoggingSuspended
+
+    def test_deferred_message_formatting(self):
+
+        """
+        Tests that log messages can be passed as a format string with
+        arguments.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        sut = LogWriter(channel_name='test', cache_entries=True)
+        sut.overwrite_log_level(new_log_level=LogLevels.DEBUG)
+        sut.debug('test %s %d', 'message', 42)
+        assert sut.CachedLogEntries[0].Message == 'test message 42'
+
+    def test_callable_message(self):
+
+        """
+        Tests that log messages can be passed as a callable.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        sut = LogWriter(channel_name='test', cache_entries=True)
+        sut.overwrite_log_level(new_log_level=LogLevels.DEBUG)
+        sut.debug(lambda: 'test')
+        assert sut.CachedLogEntries[0].Message == 'test'
+
+    def test_filtered_message_is_not_formatted(self):
+
+        """
+        Tests that messages filtered out by the log level are never formatted.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        class FormatTracker:
+            def __init__(self):
+                self.formatted = False
+            def __str__(self):
+                self.formatted = True
+                return 'tracker'
+
+        tracker = FormatTracker()
+        message = FormatTracker()
+
+        sut = LogWriter(channel_name='test', cache_entries=True)
+        sut.overwrite_log_level(new_log_level=LogLevels.INFO)
+        sut.debug('test %s', tracker)
+        sut.trace(message.__str__)
+        assert not sut.CachedLogEntries
+        assert not tracker.formatted
+        assert not message.formatted
+
+    def test_is_enabled_for(self):
+
+        """
+        Tests that the log level check of the writer works correctly.
+
+        Authors:
+            Attila Kovacs
+        """
+
+        sut = LogWriter(channel_name='test', cache_entries=True)
+        sut.overwrite_log_level(new_log_level=LogLevels.WARNING)
+        assert not sut.is_enabled_for(LogLevels.TRACE)
+        assert not sut.is_enabled_for(LogLevels.INFO)
+        assert sut.is_enabled_for(LogLevels.WARNING)
+        assert sut.is_enabled_for(LogLevels.ERROR)
+        sut.suspend_logging()
+        assert not sut.is_enabled_for(LogLevels.ERROR)